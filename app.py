@@ -1,19 +1,63 @@
 import streamlit as st
+from streamlit.delta_generator import DeltaGenerator
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
+from concurrent.futures import ThreadPoolExecutor
+from diskcache import Cache
 from dotenv import load_dotenv
 from sqlalchemy import create_engine, text
+import functools
+import hashlib
+import logging
 import os
+import select
+import threading
+import time
 from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 APP_TITLE = "Weather Dashboard"
 SCHEMA = "weather"
 TABLE = "weather_data"
+CITIES_TABLE = "cities"
+HOURLY_VIEW = "weather_hourly"
+
+# Temperature columns and the column holding them in the unit picked in the toolbar
+DISPLAY_COLS = {
+    "temperature_c": "temp_display",
+    "thermal_sensation_c": "feels_display",
+    "temp_min_c": "tmin_display",
+    "temp_max_c": "tmax_display",
+}
+
+# Columns read by the render_* functions; everything else stays in the database
+_HOT_COLS = (
+    "collection_timestamp",
+    "city",
+    "sys_country",
+    "temperature_c",
+    "thermal_sensation_c",
+    "temp_min_c",
+    "temp_max_c",
+    "humidity",
+    "pressure",
+    "wind_speed",
+    "weather_main",
+    "weather_icon",
+)
+
+CACHE_DIR = os.getenv("WEATHER_CACHE_DIR", "/tmp/wxcache")
+CITIES_CACHE_TAG = "__cities__"
+# Channel the Airflow DAG notifies with the city name after each load
+INVALIDATE_CHANNEL = "weather_invalidate"
 
 
 def get_env_variable(name: str, default: str | None = None) -> str:
@@ -32,18 +76,88 @@ def get_engine():
     port = get_env_variable("DB_PORT")
 
     url = f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{db}"
-    engine = create_engine(url, pool_pre_ping=True)
+    engine = create_engine(
+        url,
+        pool_size=25,
+        max_overflow=25,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        pool_use_lifo=True,
+        connect_args={"application_name": "weather_dashboard", "keepalives_idle": 30},
+    )
     return engine
 
 
-@st.cache_data(show_spinner=False)
+@st.cache_resource(show_spinner=False)
+def get_cache() -> Cache:
+    return Cache(CACHE_DIR, size_limit=256 << 20)
+
+
+def _cache_key_part(value) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+# Disk-backed cache shared by every Streamlit process and session; it survives
+# app restarts. Entries expire after ``ttl`` seconds and are tagged with the city
+# (first argument) so a single city can be evicted.
+def shared_cache(ttl: int, tag: str | None = None):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args):
+            raw_key = "|".join([func.__name__, *(_cache_key_part(a) for a in args)])
+            key = hashlib.sha1(raw_key.encode()).hexdigest()
+            cache = get_cache()
+            value = cache.get(key, default=None, retry=True)
+            if value is None:
+                value = func(*args)
+                entry_tag = tag if tag is not None else (args[0] if args else None)
+                cache.set(key, value, expire=ttl, tag=entry_tag, retry=True)
+            return value
+        return wrapper
+    return decorator
+
+
+def _listen_for_invalidations() -> None:
+    cache = get_cache()
+    while True:
+        try:
+            raw = get_engine().raw_connection()
+            # Keep the LISTEN connection out of the pool for the lifetime of the thread
+            raw.detach()
+            conn = raw.dbapi_connection
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                cur.execute(f"LISTEN {INVALIDATE_CHANNEL}")
+            while True:
+                if select.select([conn], [], [], 60) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    notify = conn.notifies.pop(0)
+                    cache.evict(notify.payload)
+                    cache.evict(CITIES_CACHE_TAG)
+        except Exception:
+            logger.warning("Cache invalidation listener failed, retrying in 30s", exc_info=True)
+            time.sleep(30)
+
+
+@st.cache_resource(show_spinner=False)
+def start_invalidation_listener() -> threading.Thread:
+    thread = threading.Thread(target=_listen_for_invalidations, name="weather-cache-invalidation", daemon=True)
+    thread.start()
+    return thread
+
+
+# Cities rarely change; the DAG also evicts this entry when it loads a city
+@shared_cache(ttl=3600, tag=CITIES_CACHE_TAG)
 def list_cities() -> list[str]:
     engine = get_engine()
     q = text(
         f"""
-        SELECT DISTINCT city
-        FROM {SCHEMA}.{TABLE}
-        WHERE city IS NOT NULL
+        SELECT city
+        FROM {SCHEMA}.{CITIES_TABLE}
         ORDER BY city
         """
     )
@@ -52,46 +166,104 @@ def list_cities() -> list[str]:
     return cities
 
 
-@st.cache_data(show_spinner=False)
-def load_data(city: str | None, start_dt: datetime, end_dt: datetime) -> pd.DataFrame:
+# Just under the 2-minute auto refresh so each refresh sees new hours
+@shared_cache(ttl=110)
+def load_hourly(city: str | None, start_dt: datetime, end_dt: datetime) -> pd.DataFrame:
     engine = get_engine()
     params = {"start": start_dt, "end": end_dt}
-    filters = ["collection_timestamp BETWEEN :start AND :end"]
+    filters = ["hour BETWEEN :start AND :end"]
     if city:
         filters.append("city = :city")
         params["city"] = city
 
     where_sql = " AND ".join(filters)
+    # Reads the hourly view the DAG refreshes after each load; GROUP BY only merges
+    # cities when none is selected, and ORDER BY keeps the frame chronological since
+    # the renderers never re-sort
     q = text(
         f"""
-        SELECT *
-        FROM {SCHEMA}.{TABLE}
+        SELECT hour AS collection_timestamp,
+               AVG(temperature_c) AS temperature_c,
+               AVG(humidity) AS humidity,
+               AVG(pressure) AS pressure,
+               AVG(wind_speed) AS wind_speed
+        FROM {SCHEMA}.{HOURLY_VIEW}
         WHERE {where_sql}
-        ORDER BY collection_timestamp ASC
+        GROUP BY 1
+        ORDER BY 1
         """
     )
-    
+
     with engine.connect() as conn:
-        result = conn.execute(q, params)
-        rows = result.fetchall()
-        columns = result.keys()
-        df = pd.DataFrame(rows, columns=columns)
+        df = pd.read_sql_query(q, conn, params=params, parse_dates=["collection_timestamp"])
+    return df
 
-    if not df.empty:
-        # Normalize column names to lowercase for consistent usage
-        df.columns = [c.lower() for c in df.columns]
-        # Ensure datetime type
-        df["collection_timestamp"] = pd.to_datetime(df["collection_timestamp"])
+
+@shared_cache(ttl=60)
+def load_latest(city: str | None) -> pd.DataFrame:
+    engine = get_engine()
+    params = {}
+    where_sql = "TRUE"
+    if city:
+        where_sql = "city = :city"
+        params["city"] = city
+
+    q = text(
+        f"""
+        SELECT {', '.join(_HOT_COLS)}
+        FROM {SCHEMA}.{TABLE}
+        WHERE {where_sql}
+        ORDER BY collection_timestamp DESC
+        LIMIT 1
+        """
+    )
+
+    with engine.connect() as conn:
+        df = pd.read_sql_query(q, conn, params=params)
     return df
 
-def c_to_f(value_c: float) -> float:
-    return value_c * 9.0 / 5.0 + 32.0
+def m4_downsample(df: pd.DataFrame, x_col: str, y_col: str, width_px: int = 800) -> pd.DataFrame:
+    # M4 aggregation: keep the first, last, min and max row of every pixel column,
+    # which draws identically to the full series at the given chart width
+    if len(df) <= 4 * width_px:
+        return df
+
+    data = df.reset_index(drop=True)
+    x = data[x_col]
+    if pd.api.types.is_datetime64_any_dtype(x):
+        x = x.astype("int64")
+    x_min, x_max = x.min(), x.max()
+    bins = ((x - x_min) / max(x_max - x_min, 1) * (width_px - 1)).astype("int64")
+
+    grouped = data[y_col].groupby(bins)
+    keep = np.unique(np.concatenate([
+        bins.drop_duplicates(keep="first").index.to_numpy(),
+        bins.drop_duplicates(keep="last").index.to_numpy(),
+        grouped.idxmin().to_numpy(),
+        grouped.idxmax().to_numpy(),
+    ]))
+    return data.loc[keep].reset_index(drop=True)
+
+def _clip_to_range(df: pd.DataFrame, start_dt: datetime, end_dt: datetime) -> pd.DataFrame:
+    # Drop rows with out-of-window timestamps so charts only span the requested range
+    return df[df["collection_timestamp"].between(start_dt, end_dt)]
+
+def c_to_f(value_c):
+    # Works on scalars, numpy arrays and pandas Series alike
+    return value_c * 1.8 + 32.0
+
+def _add_display_cols(df: pd.DataFrame, use_fahrenheit: bool) -> pd.DataFrame:
+    # Convert every temperature column to the selected unit in one vectorized op,
+    # so the render_* functions read *_display columns instead of converting again
+    src = [col for col in DISPLAY_COLS if col in df.columns]
+    values = df[src].to_numpy(dtype=float)
+    if use_fahrenheit:
+        values = c_to_f(values)
+    return df.assign(**{DISPLAY_COLS[col]: values[:, i] for i, col in enumerate(src)})
 
-def render_hero(df: pd.DataFrame, latest: pd.Series, use_fahrenheit: bool) -> None:
-    temp_c = float(latest.get("temperature_c", float("nan")))
-    feels_c = float(latest.get("thermal_sensation_c", float("nan")))
-    temp_display = c_to_f(temp_c) if use_fahrenheit else temp_c
-    feels_display = c_to_f(feels_c) if use_fahrenheit else feels_c
+def render_hero(latest: pd.Series, use_fahrenheit: bool) -> DeltaGenerator:
+    temp_display = float(latest.get("temp_display", float("nan")))
+    feels_display = float(latest.get("feels_display", float("nan")))
     unit = "°F" if use_fahrenheit else "°C"
 
     col_left, col_right = st.columns([2, 5], gap="large")
@@ -169,117 +341,93 @@ def render_hero(df: pd.DataFrame, latest: pd.Series, use_fahrenheit: bool) -> No
             c2.metric("Wind", f"{latest.get('wind_speed', 'N/A')} km/h")
             c3.metric("Pressure", f"{latest.get('pressure', 'N/A')} hPa")
             c4.metric("Feels like", f"{feels_display:.0f}{unit}")
-        with sub:
-            # Hourly Weather Forecast Chart
-            if not df.empty:
-                # Resample data to hourly averages
-                hourly_data = df.set_index("collection_timestamp").resample("1H").agg({
-                    "humidity": "mean",
-                    "temperature_c": "mean",
-                    "weather_main": "first",
-                    "weather_icon": "first"
-                }).dropna().reset_index()
-                
-                if not hourly_data.empty:
-                    # Limit to next 8 hours for better visibility
-                    hourly_data = hourly_data.head(8)
-                    
-                    # Convert temperature if needed
-                    temp_data = hourly_data["temperature_c"].apply(c_to_f) if use_fahrenheit else hourly_data["temperature_c"]
-                    temp_unit = "°F" if use_fahrenheit else "°C"
-                    
-                    # Create the chart
-                    fig = go.Figure()
-                    
-                    # Add area chart for precipitation/humidity
-                    fig.add_trace(go.Scatter(
-                        x=hourly_data["collection_timestamp"],
-                        y=hourly_data["humidity"],
-                        mode='lines',
-                        fill='tonexty',
-                        fillcolor='rgba(74, 144, 226, 0.3)',
-                        line=dict(color='rgba(74, 144, 226, 0.8)', width=2),
-                        name='Rain precipitation %',
-                        showlegend=False
-                    ))
-                    
-                    # Add temperature points and labels
-                    for i, row in hourly_data.iterrows():
-                        temp_val = temp_data.iloc[hourly_data.index.get_loc(i)]
-                        time_str = row["collection_timestamp"].strftime("%H:%M")
-                        
-                        # Add temperature text above the chart
-                        fig.add_annotation(
-                            x=row["collection_timestamp"],
-                            y=100,  # Position above the humidity area
-                            text=f"{temp_val:.0f}°",
-                            showarrow=False,
-                            font=dict(size=14, color="black"),
-                            yshift=20
-                        )
-                        
-                        # Add time labels at the bottom
-                        fig.add_annotation(
-                            x=row["collection_timestamp"],
-                            y=0,
-                            text=time_str,
-                            showarrow=False,
-                            font=dict(size=12, color="gray"),
-                            yshift=-20
-                        )
-                    
-                    # Update layout to match the reference design
-                    fig.update_layout(
-                        title="Upcoming hours",
-                        title_font=dict(size=16, color="black"),
-                        xaxis=dict(
-                            showgrid=False,
-                            showticklabels=False,
-                            zeroline=False,
-                            range=[hourly_data["collection_timestamp"].min(), hourly_data["collection_timestamp"].max()]
-                        ),
-                        yaxis=dict(
-                            showgrid=False,
-                            showticklabels=False,
-                            zeroline=False,
-                            range=[0, 100]
-                        ),
-                        plot_bgcolor='rgba(0,0,0,0)',
-                        paper_bgcolor='rgba(0,0,0,0)',
-                        margin=dict(l=10, r=10, t=60, b=40),
-                        height=200
-                    )
-                    
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.info("Not enough data to display hourly forecast.")
+        # Filled by render_hourly_forecast once the hourly query returns
+        return sub.empty()
+
+def render_hourly_forecast(df: pd.DataFrame, use_fahrenheit: bool) -> None:
+    # Hourly Weather Forecast Chart
+    if not df.empty:
+        # Rows are already hourly averages computed by the database
+        hourly_data = df.dropna(subset=["humidity", "temperature_c"]).reset_index(drop=True)
+        
+        if not hourly_data.empty:
+            # Limit to the 8 most recent hours for better visibility
+            hourly_data = hourly_data.tail(8)
+            
+            temp_data = hourly_data["temp_display"]
+            temp_unit = "°F" if use_fahrenheit else "°C"
+            
+            # Create the chart
+            fig = go.Figure()
+            
+            # Add area chart for precipitation/humidity
+            fig.add_trace(go.Scatter(
+                x=hourly_data["collection_timestamp"],
+                y=hourly_data["humidity"],
+                mode='lines',
+                fill='tonexty',
+                fillcolor='rgba(74, 144, 226, 0.3)',
+                line=dict(color='rgba(74, 144, 226, 0.8)', width=2),
+                name='Rain precipitation %',
+                showlegend=False
+            ))
+            
+            # Add temperature labels above the chart and time labels at the bottom
+            times = pd.DatetimeIndex(hourly_data["collection_timestamp"])
+            temp_labels = [f"{v:.0f}°" for v in np.asarray(temp_data)]
+            time_labels = times.strftime("%H:%M")
+            annotations = [
+                dict(x=t, y=100, text=label, showarrow=False, font=dict(size=14, color="black"), yshift=20)
+                for t, label in zip(times, temp_labels)
+            ] + [
+                dict(x=t, y=0, text=label, showarrow=False, font=dict(size=12, color="gray"), yshift=-20)
+                for t, label in zip(times, time_labels)
+            ]
+            
+            # Update layout to match the reference design
+            fig.update_layout(
+                annotations=annotations,
+                title="Upcoming hours",
+                title_font=dict(size=16, color="black"),
+                xaxis=dict(
+                    showgrid=False,
+                    showticklabels=False,
+                    zeroline=False,
+                    range=[hourly_data["collection_timestamp"].min(), hourly_data["collection_timestamp"].max()]
+                ),
+                yaxis=dict(
+                    showgrid=False,
+                    showticklabels=False,
+                    zeroline=False,
+                    range=[0, 100]
+                ),
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                margin=dict(l=10, r=10, t=60, b=40),
+                height=200
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("Not enough data to display hourly forecast.")
+    else:
+        st.info("No weather data found for the selected range. Ensure the ETL is still loading data into the database.")
 
 def render_hourly_chart(df: pd.DataFrame, use_fahrenheit: bool) -> None:
     if df.empty:
         st.info("No data available for the selected range.")
         return
-    hourly = (
-        df.set_index("collection_timestamp")["temperature_c"]
-        .resample("1H")
-        .mean()
-        .dropna()
-        .reset_index()
-    )
+    hourly = df[["collection_timestamp", "temp_display"]].dropna().reset_index(drop=True)
     if hourly.empty:
         st.info("Not enough data to draw an hourly chart.")
         return
-
-    if use_fahrenheit:
-        hourly["temperature"] = hourly["temperature_c"].apply(c_to_f)
-        y_title = "Temperature (°F)"
-    else:
-        hourly["temperature"] = hourly["temperature_c"]
-        y_title = "Temperature (°C)"
+    hourly = m4_downsample(hourly, "collection_timestamp", "temp_display")
+    y_title = "Temperature (°F)" if use_fahrenheit else "Temperature (°C)"
 
     fig = px.area(
         hourly,
         x="collection_timestamp",
-        y="temperature",
+        y="temp_display",
         title="Upcoming hours",
     )
     fig.update_traces(line_color="#4A90E2")
@@ -295,90 +443,101 @@ def render_extra_timeseries(df: pd.DataFrame) -> None:
         ("Pressure (hPa)", "pressure"),
         ("Wind speed (km/h)", "wind_speed"),
     ]
+    # All metrics share one projection of the hourly frame
+    metrics = [key for _, key in series_map]
+    agg = df[["collection_timestamp", *metrics]].dropna(subset=metrics, how="all").reset_index(drop=True)
     for col, (title, key) in zip(cols, series_map):
         with col:
-            s = (
-                df.set_index("collection_timestamp")[key]
-                .resample("1H")
-                .mean()
-                .dropna()
-                .reset_index()
-            )
+            s = agg.loc[agg[key].notna(), ["collection_timestamp", key]]
             if s.empty:
                 st.info(f"No {key} data")
                 continue
+            s = m4_downsample(s, "collection_timestamp", key)
             fig = px.line(s, x="collection_timestamp", y=key, title=title)
             fig.update_layout(margin=dict(l=10, r=10, t=40, b=0))
             st.plotly_chart(fig, use_container_width=True)
 
 def render_detail_cards(latest: pd.Series, use_fahrenheit: bool) -> None:
     cols = st.columns(6)
+    # Already converted by _add_display_cols; one lookup instead of a get() per card
+    feels, tmin, tmax = latest[["feels_display", "tmin_display", "tmax_display"]].fillna(0).to_numpy(dtype="float32")
+    unit = "°F" if use_fahrenheit else "°C"
     values = {
         "Humidity": f"{latest.get('humidity', 'N/A')}%",
         "Wind": f"{latest.get('wind_speed', 'N/A')} km/h",
         "Pressure": f"{latest.get('pressure', 'N/A')} hPa",
-        "Feels like": f"{c_to_f(float(latest.get('thermal_sensation_c', 0))) if use_fahrenheit else float(latest.get('thermal_sensation_c', 0)):.0f}{'°F' if use_fahrenheit else '°C'}",
-        "Temp min": f"{c_to_f(float(latest.get('temp_min_c', 0))) if use_fahrenheit else float(latest.get('temp_min_c', 0)):.0f}{'°F' if use_fahrenheit else '°C'}",
-        "Temp max": f"{c_to_f(float(latest.get('temp_max_c', 0))) if use_fahrenheit else float(latest.get('temp_max_c', 0)):.0f}{'°F' if use_fahrenheit else '°C'}",
+        "Feels like": f"{feels:.0f}{unit}",
+        "Temp min": f"{tmin:.0f}{unit}",
+        "Temp max": f"{tmax:.0f}{unit}",
     }
     for col, (label, value) in zip(cols, values.items()):
         with col:
             st.metric(label, value)
 
+def _date_window(date_range: tuple | None) -> tuple[datetime, datetime]:
+    # Without a selection the window is yesterday and today, recomputed on every
+    # run so a tab left open past midnight rolls over to the new day
+    today = datetime.now().date()
+    if isinstance(date_range, tuple) and len(date_range) == 2:
+        start_date, end_date = date_range
+    else:
+        start_date, end_date = today - timedelta(days=1), today
+    return datetime.combine(start_date, datetime.min.time()), datetime.combine(end_date, datetime.max.time())
+
+# Only this block reruns on the 2-minute auto refresh; the toolbar stays put
+@st.fragment(run_every="120s")
+def render_dashboard(city: str | None, date_range: tuple | None, unit_f: bool) -> None:
+    start_dt, end_dt = _date_window(date_range)
+
+    # Start the hourly query right away; the hero card only needs the latest row
+    # and is painted while the chart data is still loading
+    with ThreadPoolExecutor(max_workers=1, initializer=add_script_run_ctx, initargs=(None, get_script_run_ctx())) as executor:
+        hourly_future = executor.submit(load_hourly, city, start_dt, end_dt)
+
+        latest = load_latest(city)
+
+        if latest.empty:
+            st.warning("No weather data found. Ensure the ETL has loaded data into the database.")
+            return
+
+        latest_row = _add_display_cols(latest, unit_f).iloc[0]
+
+        # ---------- Hero section ----------
+        st.divider()
+        forecast_slot = render_hero(latest_row, unit_f)
+        st.divider()
+        st.info("Weather forecast is provided by the OpenWeatherMap API.", icon=":material/water_drop:")
+
+        df = _add_display_cols(_clip_to_range(hourly_future.result(), start_dt, end_dt), unit_f)
+        with forecast_slot.container():
+            render_hourly_forecast(df, unit_f)
+
 def main():
     st.set_page_config(page_title=APP_TITLE, layout="wide")
     st.markdown('<style> #MainMenu {visibility:hidden;} footer {visibility: hidden;} .stAppHeader {visibility: hidden;}</style>', unsafe_allow_html=True)
     
     st.title(APP_TITLE)
 
-    # --- Auto refresh every 2 minutes: clear cache then rerun ---
-    now = datetime.now()
-    last_refresh = st.session_state.get("_last_auto_refresh_at")
-    if last_refresh is None:
-        st.session_state["_last_auto_refresh_at"] = now
-    else:
-        if (now - last_refresh).total_seconds() >= 120:
-            st.cache_data.clear()
-            st.session_state["_last_auto_refresh_at"] = now
-            st.rerun()
+    # Cached queries are evicted per city when the DAG loads new data
+    start_invalidation_listener()
 
     # ---------- Top toolbar (no sidebar) ----------
     cities = list_cities()
     default_city = cities[0] if cities else None
-    today = datetime.now().date()
-    default_start = datetime.combine(today - timedelta(days=1), datetime.min.time())
-    default_end = datetime.combine(today, datetime.max.time())
 
     t1, t2, t3, t4 = st.columns([2, 3, 1, 1])
     with t1:
         city = st.selectbox("City", options=cities, index=0 if default_city in cities else None, placeholder="Select a city")
     with t2:
-        date_range = (default_start.date(), default_end.date())
-        #date_range = st.date_input("Date range", (default_start.date(), default_end.date()))
+        # None selects the default window, resolved by the fragment on each refresh
+        date_range = None
+        #today = datetime.now().date()
+        #date_range = st.date_input("Date range", (today - timedelta(days=1), today))
     with t4:
         unit_f = st.toggle("°F", value=False, help="Toggle temperature unit")
     
 
-    # Normalize date range
-    if isinstance(date_range, tuple) and len(date_range) == 2:
-        start_dt = datetime.combine(date_range[0], datetime.min.time())
-        end_dt = datetime.combine(date_range[1], datetime.max.time())
-    else:
-        start_dt, end_dt = default_start, default_end
-
-    df = load_data(city, start_dt, end_dt)
-
-    if df.empty:
-        st.warning("No weather data found. Ensure the ETL has loaded data into the database.")
-        return
-
-    latest_row = df.sort_values("collection_timestamp").iloc[-1]
-
-    # ---------- Hero section ----------
-    st.divider()
-    render_hero(df, latest_row, unit_f)
-    st.divider()
-    st.info("Weather forecast is provided by the OpenWeatherMap API.", icon=":material/water_drop:")
+    render_dashboard(city, date_range, unit_f)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
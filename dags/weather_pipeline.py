@@ -3,7 +3,8 @@ from airflow.operators.python import PythonOperator
 from airflow.models import Variable
 
 from datetime import datetime, timedelta
-import os, json, requests, pandas as pd
+import os, io, csv, json, httpx, pandas as pd
+from joblib import Parallel, delayed
 from sqlalchemy import create_engine, text
 
 from urllib.parse import quote_plus
@@ -12,9 +13,11 @@ DATA_DIR = "/tmp"
 os.makedirs(DATA_DIR, exist_ok=True)
 
 RAW_PATH = f"{DATA_DIR}/weather_raw.json"
-CLEAN_PATH = f"{DATA_DIR}/weather_clean.csv"
+CLEAN_PATH = f"{DATA_DIR}/weather_clean.parquet"
 
-CITY = "Rio de Janeiro"
+# Comma-separated list of cities to collect, e.g. "Rio de Janeiro,São Paulo"
+CITIES = [c.strip() for c in os.getenv("WEATHER_CITIES", "Rio de Janeiro").split(",") if c.strip()]
+CITY_CHUNK_SIZE = 100
 OPENWEATHER_API_KEY = os.getenv("OPENWEATHER_API_KEY")
 
 
@@ -28,7 +31,7 @@ def _pg_url_from_env(database: str = "postgres") -> str:
     encoded_password = quote_plus(password)
 
     print(f"Connecting to Supabase: {host}:{port}/{database} with user {user}")
-    return f"postgresql+psycopg2://{user}:{encoded_password}@{host}:{port}/{database}?sslmode=require"
+    return f"postgresql+psycopg2://{user}:{encoded_password}@{host}:{port}/{database}?sslmode=require&application_name=weather_pipeline&keepalives_idle=30"
 
 def _ensure_schema_exists(engine):
     try:
@@ -72,10 +75,18 @@ def _ensure_table_exists(engine):
         collection_timestamp TIMESTAMP NOT NULL
     )
     """
+
+    # Support the dashboard's per-city time window and latest-row scans
+    create_indexes_sql = [
+        "CREATE INDEX IF NOT EXISTS weather_data_city_ts_idx ON weather.weather_data (city, collection_timestamp DESC)",
+        "CREATE INDEX IF NOT EXISTS weather_data_ts_idx ON weather.weather_data (collection_timestamp DESC)",
+    ]
     
     try:
         with engine.begin() as conn:
             conn.execute(text(create_table_sql))
+            for index_sql in create_indexes_sql:
+                conn.execute(text(index_sql))
             
         print("Table 'weather.weather_data' ensured to exist with correct schema and NOT NULL constraints")
     except Exception as e:
@@ -83,44 +94,129 @@ def _ensure_table_exists(engine):
         raise
 
 
-def extract():
+def _ensure_cities_table_exists(engine):
+
+    create_table_sql = """
+    CREATE TABLE IF NOT EXISTS weather.cities (
+        city VARCHAR(100) PRIMARY KEY,
+        country VARCHAR(100),
+        last_seen TIMESTAMPTZ
+    )
+    """
+
+    # Backfill cities already present in weather_data. The NOT EXISTS guard is a
+    # one-time filter, so once the table has rows the fact table is not scanned;
+    # the upsert in load() keeps it current from then on
+    backfill_sql = """
+    INSERT INTO weather.cities (city, country, last_seen)
+    SELECT city, MAX(sys_country), MAX(collection_timestamp)
+    FROM weather.weather_data
+    WHERE NOT EXISTS (SELECT 1 FROM weather.cities)
+    GROUP BY city
+    ON CONFLICT (city) DO NOTHING
+    """
+
+    try:
+        with engine.begin() as conn:
+            conn.execute(text(create_table_sql))
+            conn.execute(text(backfill_sql))
+
+        print("Table 'weather.cities' ensured to exist")
+    except Exception as e:
+        print(f"Cities table creation failed: {e}")
+        raise
+
+
+def _ensure_hourly_view_exists(engine):
+
+    # Hourly aggregates read by the dashboard, refreshed by load() after each insert
+    create_view_sql = """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS weather.weather_hourly AS
+    SELECT
+        city,
+        date_trunc('hour', collection_timestamp) AS hour,
+        AVG(temperature_c) AS temperature_c,
+        AVG(humidity) AS humidity,
+        AVG(pressure) AS pressure,
+        AVG(wind_speed) AS wind_speed,
+        (array_agg(weather_main ORDER BY collection_timestamp DESC))[1] AS weather_main,
+        (array_agg(weather_icon ORDER BY collection_timestamp DESC))[1] AS weather_icon
+    FROM weather.weather_data
+    GROUP BY 1, 2
+    """
+
+    # REFRESH ... CONCURRENTLY requires a unique index on the view
+    create_index_sql = "CREATE UNIQUE INDEX IF NOT EXISTS weather_hourly_city_hour_idx ON weather.weather_hourly (city, hour)"
+
+    try:
+        with engine.begin() as conn:
+            conn.execute(text(create_view_sql))
+            conn.execute(text(create_index_sql))
+
+        print("Materialized view 'weather.weather_hourly' ensured to exist")
+    except Exception as e:
+        print(f"Materialized view creation failed: {e}")
+        raise
+
+
+def _psql_insert_copy(table, conn, keys, data_iter):
+    # pandas to_sql insertion method that streams rows through COPY ... FROM STDIN
+    # instead of issuing one INSERT per row
+    dbapi_conn = conn.connection
+    with dbapi_conn.cursor() as cur:
+        buf = io.StringIO()
+        csv.writer(buf).writerows(data_iter)
+        buf.seek(0)
+
+        columns = ", ".join(f'"{k}"' for k in keys)
+        table_name = f"{table.schema}.{table.name}" if table.schema else table.name
+        cur.copy_expert(f"COPY {table_name} ({columns}) FROM STDIN WITH CSV", buf)
+
+
+def _fetch_one(client: httpx.Client, city: str) -> dict:
+    response = client.get(
+        "https://api.openweathermap.org/data/2.5/weather",
+        params={"q": city, "appid": OPENWEATHER_API_KEY},
+    )
+    response.raise_for_status()
+
+    return response.json()
+
+def extract(cities: list[str]):
     if not OPENWEATHER_API_KEY:
         raise ValueError("OPENWEATHER_API_KEY is not set")
-    
-    url = f"https://api.openweathermap.org/data/2.5/weather?q={CITY}&appid={OPENWEATHER_API_KEY}"
+    if not cities:
+        raise ValueError("No cities to collect; set WEATHER_CITIES to a comma-separated list of city names")
 
-    response = requests.get(url, timeout=30)
-    response.raise_for_status()
+    # API calls are I/O bound and independent, so threads fetch them concurrently
+    # over a shared keep-alive HTTP/2 connection instead of one handshake per city
+    with httpx.Client(http2=True, timeout=30, limits=httpx.Limits(max_keepalive_connections=20)) as client:
+        data = Parallel(n_jobs=-1, prefer="threads")(delayed(_fetch_one)(client, city) for city in cities)
 
-    data = response.json()
     with open(RAW_PATH, "w") as f:
         json.dump(data, f)
 
     return data
 
-def transform():
-    
-    with open(RAW_PATH, "r") as f:
-        data = json.load(f)
-
-    df = pd.json_normalize(data)
-
+def _flatten(data: dict) -> dict:
     #Normalize weather data
-    weather_data = df['weather'][0][0]
-    
-    df['weather_id'] = weather_data['id']
-    df['weather_main'] = weather_data['main']
-    df['weather_description'] = weather_data['description']
-    df['weather_icon'] = f"https://openweathermap.org/img/wn/{weather_data['icon']}@2x.png"
-
-    df['sys_sunrise'] = df['sys.sunrise'] + df['timezone']
-    df['sys_sunset'] = df['sys.sunset'] + df['timezone']
-    
-    df['sys_sunrise'] = pd.to_datetime(df['sys_sunrise'], unit='s').dt.round('ms')
-    df['sys_sunset'] = pd.to_datetime(df['sys_sunset'], unit='s').dt.round('ms')
+    weather_data = data['weather'][0]
+
+    # Flatten the payload and add derived fields before building the DataFrame
+    return {
+        **pd.json_normalize(data, sep='.').iloc[0].to_dict(),
+        'weather_id': weather_data['id'],
+        'weather_main': weather_data['main'],
+        'weather_description': weather_data['description'],
+        'weather_icon': f"https://openweathermap.org/img/wn/{weather_data['icon']}@2x.png",
+        'sys_sunrise': pd.to_datetime(data['sys']['sunrise'] + data['timezone'], unit='s').round('ms'),
+        'sys_sunset': pd.to_datetime(data['sys']['sunset'] + data['timezone'], unit='s').round('ms'),
+        # Add timestamp
+        'collection_timestamp': pd.Timestamp.now(),
+    }
 
-    # Add timestamp
-    df['collection_timestamp'] = pd.Timestamp.now()
+def _transform_chunk(payloads: list[dict]) -> pd.DataFrame:
+    df = pd.DataFrame([_flatten(data) for data in payloads])
 
     columns_to_keep = {
         'name': 'city',
@@ -157,12 +253,29 @@ def transform():
 
         df_transformed[col_c] = df_transformed[col] - 273.15
 
-    df_transformed.to_csv(CLEAN_PATH, index=False)
     return df_transformed
 
+def transform():
+    
+    with open(RAW_PATH, "r") as f:
+        payloads = json.load(f)
+
+    if not payloads:
+        raise ValueError(f"No weather payloads found in {RAW_PATH}")
+
+    chunks = [payloads[i:i + CITY_CHUNK_SIZE] for i in range(0, len(payloads), CITY_CHUNK_SIZE)]
+    frames = Parallel(n_jobs=min(len(chunks), os.cpu_count() or 1))(
+        delayed(_transform_chunk)(chunk) for chunk in chunks
+    )
+    df_transformed = pd.concat(frames, ignore_index=True)
+
+    # Parquet keeps dtypes (timestamps included) between transform and load
+    df_transformed.to_parquet(CLEAN_PATH, index=False, compression="zstd")
+    return CLEAN_PATH
+
 def load():
     
-    df = pd.read_csv(CLEAN_PATH)
+    df = pd.read_parquet(CLEAN_PATH)
 
     engine = create_engine(
         _pg_url_from_env(),
@@ -172,10 +285,31 @@ def load():
 
     _ensure_schema_exists(engine)
     _ensure_table_exists(engine)
+    _ensure_cities_table_exists(engine)
+    _ensure_hourly_view_exists(engine)
 
     try: 
         with engine.connect() as conn:
-            df.to_sql("weather_data", conn, if_exists="append", index=False, schema="weather")
+            df.to_sql("weather_data", conn, if_exists="append", index=False, schema="weather", method=_psql_insert_copy)
+
+        # Refresh the hourly aggregates, keep the city dimension current and tell
+        # the dashboard to drop its cached results for the loaded cities
+        cities = df[["city", "sys_country"]].dropna(subset=["city"]).drop_duplicates("city")
+        with engine.begin() as conn:
+            conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY weather.weather_hourly"))
+            for city, country in cities.itertuples(index=False):
+                conn.execute(
+                    text(
+                        """
+                        INSERT INTO weather.cities (city, country, last_seen)
+                        VALUES (:city, :country, now())
+                        ON CONFLICT (city) DO UPDATE
+                        SET country = EXCLUDED.country, last_seen = EXCLUDED.last_seen
+                        """
+                    ),
+                    {"city": city, "country": country},
+                )
+                conn.execute(text("SELECT pg_notify('weather_invalidate', :city)"), {"city": city})
     except Exception as e:
         print("Error loading data into database")
         raise
@@ -196,6 +330,7 @@ with DAG(
     t_extract = PythonOperator(
         task_id="extract",
         python_callable=extract,
+        op_kwargs={"cities": CITIES},
     )
 
     t_transform = PythonOperator(